@@ -1,6 +1,5 @@
 import matplotlib.pyplot as plt
 import pandas as pd
-import numpy as np
 
 # Standard Matplotlib Template
 # Use this for publication-quality static charts
@@ -40,12 +39,9 @@ ax.spines['top'].set_visible(False)
 ax.spines['right'].set_visible(False)
 ax.grid(axis='x', alpha=0) # Hide vertical grid lines
 
-# Add value labels on top of bars
-for bar in bars:
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height,
-            f'{height}',
-            ha='center', va='bottom')
+# Add value labels on top of bars (requires matplotlib >= 3.4)
+# Labels come from the data so values keep their full precision
+ax.bar_label(bars, labels=df['Value'].astype(str), padding=3)
 
 plt.tight_layout()
 
@@ -1,32 +1,112 @@
-import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 
 # Interactive Plotly Template
 # Use this for web-based, interactive dashboards and exploration
 
 # 1. Setup Data
 # df = pd.read_csv('your_data.csv')
+periods = 30
 data = {
-    'Date': pd.date_range(start='2023-01-01', periods=30, freq='D'),
-    'Sales': [x + (x*0.1) for x in range(30)],
-    'Region': ['North']*15 + ['South']*15
+    'Date': pd.date_range(start='2023-01-01', periods=periods, freq='D'),
+    'Sales': np.arange(periods) * 1.1,
+    'Region': np.repeat(['North', 'South'], [periods // 2, periods - periods // 2])
 }
 df = pd.DataFrame(data)
+# read_csv leaves dates as strings; downsampling and plotting need datetimes
+df['Date'] = pd.to_datetime(df['Date'])
+# Drop any timezone but keep local wall-clock time, which is what plotly shows
+# for tz-aware dates; converting those to epoch values would shift them to UTC
+df['Date'] = df['Date'].dt.tz_localize(None)
+# Store repeated labels as a category: one dictionary plus small integer codes
+df['Region'] = df['Region'].astype('category')
 
-# 2. Create Plot
+# 2. Downsample for Display
+# Plotly hit-tests every vertex on hover, so large series stay sluggish even
+# with WebGL. Largest-Triangle-Three-Buckets keeps n_out visually significant
+# points per series; inputs already at or below n_out pass through unchanged.
+def downsample(df, x='Date', y='Sales', n_out=2000):
+    n = len(df)
+    if n <= n_out or n_out < 3:
+        return df
+    xs = df[x].to_numpy()
+    if np.issubdtype(xs.dtype, np.datetime64):
+        xs = xs.astype('datetime64[ns]').astype(np.int64)
+    xs = xs.astype(np.float64)
+    ys = df[y].to_numpy(dtype=np.float64)
+
+    # First and last points are always kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        next_x, next_y = xs[hi:next_hi].mean(), ys[hi:next_hi].mean()
+        a = keep[i]
+        area = np.abs((xs[a] - next_x) * (ys[lo:hi] - ys[a]) - (xs[a] - xs[lo:hi]) * (next_y - ys[a]))
+        keep[i + 1] = lo + np.argmax(area)
+    return df.iloc[keep]
+
+# 3. Create Plot
 # Example: Interactive Line Chart with Range Slider
-fig = px.line(
-    df, 
-    x='Date', 
-    y='Sales', 
-    color='Region',
-    title='Sales Trend Over Time',
-    markers=True,
-    template='plotly_white'
-)
+# Scattergl draws on the GPU instead of as SVG nodes; SVG becomes unusably
+# slow past ~15k points, WebGL stays smooth into the millions. Traces take
+# plain NumPy arrays, so the payload no longer repeats the region per row, and
+# plotly >= 6 ships numeric arrays as base64 typed arrays instead of JSON text.
+fig = go.Figure(layout_template='plotly_white')
+for region, group in df.groupby('Region', sort=False, observed=True):
+    group = downsample(group)
+    # Dates go out as epoch milliseconds rather than ISO strings. float64 keeps
+    # them in the binary typed-array encoding, which has no int64 type. Dates
+    # are tz-naive local time here (see setup), so no UTC shift is applied.
+    x_ms = group['Date'].to_numpy().astype('datetime64[ms]').astype(np.int64).astype(np.float64)
+    fig.add_trace(go.Scattergl(
+        x=x_ms,
+        y=group['Sales'].to_numpy(dtype=np.float64),
+        name=region,
+        mode='lines+markers'
+    ))
 
-# 3. Customization
+# Past ~200k rows, rasterize every point on the server with datashader
+# (optional) into a fixed-size image drawn beneath the traces; the traces
+# stay on top for hover and the legend.
+if len(df) > 200_000:
+    try:
+        import datashader as ds
+        import datashader.transfer_functions as tf
+    except ImportError:
+        ds = None
+
+    if ds is not None:
+        # Rasterize on epoch milliseconds, the unit plotly date axes use
+        points = pd.DataFrame({
+            'x': df['Date'].to_numpy().astype('datetime64[ms]').astype(np.int64),
+            'y': df['Sales'].to_numpy(dtype=np.float64),
+            'Region': df['Region'].to_numpy()
+        })
+        x0, x1 = points['x'].min(), points['x'].max()
+        y0, y1 = points['y'].min(), points['y'].max()
+        canvas = ds.Canvas(plot_width=800, plot_height=400, x_range=(x0, x1), y_range=(y0, y1))
+        # Aggregate per region so lines are not joined across regions
+        counts = sum(
+            canvas.line(group, 'x', 'y', agg=ds.count())
+            for _, group in points.groupby('Region', sort=False)
+        )
+        fig.add_layout_image(
+            source=tf.shade(counts, how='eq_hist').to_pil(),
+            xref='x',
+            yref='y',
+            x=x0,
+            y=y1,
+            sizex=x1 - x0,
+            sizey=y1 - y0,
+            sizing='stretch',
+            layer='below'
+        )
+
+# 4. Customization
 fig.update_layout(
     title={
         'text': "Sales Trend Over Time",
@@ -37,9 +117,11 @@ fig.update_layout(
         'font': {'size': 24}
     },
     xaxis_title="Date",
+    xaxis_type="date", # x values are epoch milliseconds
     yaxis_title="Sales Volume ($)",
     hovermode="x unified",
     legend=dict(
+        title="Region",
         yanchor="top",
         y=0.99,
         xanchor="left",
@@ -47,9 +129,15 @@ fig.update_layout(
     )
 )
 
+# Unified hover walks every trace on each mouse move and freezes the page
+# above ~50k points; for inputs that large switch to nearest-point hover
+# with spikes off
+if len(df) > 50_000:
+    fig.update_layout(hovermode='x', spikedistance=0, hoverdistance=1)
+
 # Add Range Slider
 fig.update_xaxes(rangeslider_visible=True)
 
-# 4. Show or Save
+# 5. Show or Save
 # fig.write_html("interactive_chart.html")
 fig.show()
@@ -9,11 +9,15 @@ import numpy as np
 # 1. Setup Data
 # df = pd.read_csv('your_data.csv')
 # Generating sample data
-np.random.seed(42)
+n = 100
+rng = np.random.default_rng(42)
+x = rng.standard_normal(n)
+y = rng.standard_normal(n)
+y += rng.standard_normal(n)
 df = pd.DataFrame({
-    'x': np.random.normal(size=100),
-    'y': np.random.normal(size=100) + np.random.normal(size=100),
-    'category': np.random.choice(['Group A', 'Group B'], 100)
+    'x': x,
+    'y': y,
+    'category': rng.choice(['Group A', 'Group B'], n)
 })
 
 # 2. Configure Style
@@ -1,3 +1,5 @@
+import sys
+
 import pandas as pd
 import numpy as np
 
@@ -15,7 +17,11 @@ data = {
     'Amount': [500000, 120000, -200000, -80000, -45000, -60000, -30000, -40000],
     'Period': ['2023-Q1'] * 8
 }
-df = pd.DataFrame(data)
+# Arrow-backed columns use Arrow's vectorized compute kernels and hand off
+# zero-copy to Arrow-aware tools such as Polars or DuckDB
+df = pd.DataFrame(data).convert_dtypes(dtype_backend='pyarrow')
+# Store repeated labels as categories: one dictionary plus small integer codes
+df = df.astype({'Account': 'category', 'Sub-Account': 'category', 'Period': 'category'})
 
 # 2. Define Structure
 structure = {
@@ -29,47 +35,71 @@ structure = {
 }
 
 # 3. Calculate Totals
-def get_total(df, sub_accounts):
-    return df[df['Sub-Account'].isin(sub_accounts)]['Amount'].sum()
+# Sum each sub-account once; line items are then dictionary lookups
+def sum_by_code(codes, amounts, n):
+    # -1 marks a missing sub-account; missing amounts are skipped like pandas sum()
+    valid = (codes >= 0) & ~np.isnan(amounts)
+    return np.bincount(codes[valid], weights=amounts[valid], minlength=n)
+
+# Sub-Account is categorical, so its integer codes are ready without hashing
+codes = df['Sub-Account'].cat.codes.to_numpy()
+sub_accounts = df['Sub-Account'].cat.categories
+ledger_amounts = df['Amount'].to_numpy(dtype=np.float64)
+totals = dict(zip(sub_accounts, sum_by_code(codes, ledger_amounts, len(sub_accounts))))
 
-revenue = get_total(df, structure['Revenue'])
-cogs = get_total(df, structure['Cost of Goods Sold'])
+def get_total(totals, sub_accounts):
+    return sum(totals.get(sub_account, 0) for sub_account in sub_accounts)
+
+revenue = get_total(totals, structure['Revenue'])
+cogs = get_total(totals, structure['Cost of Goods Sold'])
 gross_profit = revenue + cogs # cogs is negative
 
-opex = get_total(df, structure['Operating Expenses'])
+opex = get_total(totals, structure['Operating Expenses'])
 operating_income = gross_profit + opex # opex is negative
 
-taxes = get_total(df, structure['Taxes'])
+taxes = get_total(totals, structure['Taxes'])
 net_income = operating_income + taxes # taxes is negative
 
 # 4. Create Statement DataFrame
-statement_data = [
-    {'Line Item': 'Revenue', 'Amount': revenue, 'Type': 'Header'},
-    {'Line Item': '  Product Sales', 'Amount': get_total(df, ['Product Sales']), 'Type': 'Detail'},
-    {'Line Item': '  Service Revenue', 'Amount': get_total(df, ['Service Revenue']), 'Type': 'Detail'},
-    {'Line Item': 'Cost of Goods Sold', 'Amount': cogs, 'Type': 'Header'},
-    {'Line Item': 'Gross Profit', 'Amount': gross_profit, 'Type': 'Total'},
-    {'Line Item': 'Operating Expenses', 'Amount': opex, 'Type': 'Header'},
-    {'Line Item': 'Operating Income', 'Amount': operating_income, 'Type': 'Total'},
-    {'Line Item': 'Net Income', 'Amount': net_income, 'Type': 'Grand Total'},
+# Built column by column: Amount lands in one contiguous float64 array
+line_items = [
+    'Revenue',
+    '  Product Sales',
+    '  Service Revenue',
+    'Cost of Goods Sold',
+    'Gross Profit',
+    'Operating Expenses',
+    'Operating Income',
+    'Net Income',
 ]
-statement_df = pd.DataFrame(statement_data)
+line_amounts = np.array([
+    revenue,
+    totals.get('Product Sales', 0),
+    totals.get('Service Revenue', 0),
+    cogs,
+    gross_profit,
+    opex,
+    operating_income,
+    net_income,
+], dtype=np.float64)
+line_types = ['Header', 'Detail', 'Detail', 'Header', 'Total', 'Header', 'Total', 'Grand Total']
+statement_df = pd.DataFrame({
+    'Line Item': line_items,
+    'Amount': line_amounts,
+    'Type': pd.Categorical(line_types),
+})
 
 # 5. Format and Export
-print("Income Statement (2023-Q1)")
-print("-" * 40)
-for _, row in statement_df.iterrows():
-    amount_str = f"${abs(row['Amount']):,.2f}"
-    if row['Amount'] < 0 and row['Type'] != 'Total': # Display negative numbers in parentheses if preferred, but here we used signed math
-        amount_str = f"(${abs(row['Amount']):,.2f})"
-    
-    if row['Type'] == 'Grand Total':
-        print(f"{row['Line Item'].ljust(25)} {amount_str.rjust(15)}")
-        print("=" * 40)
-    elif row['Type'] == 'Total':
-        print(f"{row['Line Item'].ljust(25)} {amount_str.rjust(15)}")
-        print("-" * 40)
-    else:
-        print(f"{row['Line Item'].ljust(25)} {amount_str.rjust(15)}")
+amounts = statement_df['Amount']
+amount_str = amounts.abs().map('${:,.2f}'.format)
+# Display negative numbers in parentheses (totals keep their signed math)
+amount_str = amount_str.where((amounts >= 0) | (statement_df['Type'] == 'Total'), '(' + amount_str + ')')
+lines = statement_df['Line Item'].str.ljust(25) + ' ' + amount_str.str.rjust(15)
+# Totals are followed by a rule line
+rules = statement_df['Type'].map({'Total': '\n' + '-' * 40, 'Grand Total': '\n' + '=' * 40}).fillna('')
+
+# Emit the whole report in one write rather than one print per line
+report = ["Income Statement (2023-Q1)", "-" * 40, *(lines + rules)]
+sys.stdout.write("\n".join(report) + "\n")
 
 # statement_df.to_excel('income_statement.xlsx', index=False)
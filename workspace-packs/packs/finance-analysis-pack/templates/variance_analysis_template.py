@@ -13,7 +13,8 @@ data = {
     'Actual': [120000, 45000, 150000, 20000, 25000],
     'Budget': [100000, 50000, 140000, 20000, 22000]
 }
-df = pd.DataFrame(data)
+df = pd.DataFrame(data).convert_dtypes(dtype_backend='pyarrow')
+df['Department'] = df['Department'].astype('category')
 
 # 2. Calculate Variance
 df['Variance ($)'] = df['Actual'] - df['Budget']
@@ -21,25 +22,37 @@ df['Variance (%)'] = (df['Variance ($)'] / df['Budget']) * 100
 
 # 3. Flag Significant Variances
 # Threshold: +/- 10%
-df['Status'] = df['Variance (%)'].apply(
-    lambda x: 'Red' if x > 10 else ('Green' if x < -10 else 'Yellow')
+# Arrow comparisons propagate missing values; a missing variance counts as Yellow
+df['Status'] = np.select(
+    [
+        (df['Variance (%)'] > 10).fillna(False).to_numpy(bool),
+        (df['Variance (%)'] < -10).fillna(False).to_numpy(bool),
+    ],
+    ['Red', 'Green'],
+    default='Yellow'
 )
 # Note: Logic depends on if higher is better (Revenue) or worse (Expenses). 
 # Assuming Expenses here (Higher Actual = Bad/Red).
 
 # 4. Create Summary
+# Format whole columns at once; to_string sizes and aligns each column.
+# Department (label included) is padded to a common width so it stays flush left.
+dept_width = max(len('Department'), df['Department'].astype(str).str.len().max())
+report = pd.DataFrame({
+    'Department'.ljust(dept_width): df['Department'].astype(str).str.ljust(dept_width),
+    'Actual': df['Actual'].map('${:,.0f}'.format),
+    'Budget': df['Budget'].map('${:,.0f}'.format),
+    'Var ($)': df['Variance ($)'].map('${:,.0f}'.format),
+    'Var (%)': df['Variance (%)'].map('{:.1f}%'.format),
+    'Status': df['Status']
+}).to_string(index=False)
+header, body = report.split("\n", 1)
+
 print("Variance Analysis Report")
-print("=" * 60)
-print(f"{'Department':<15} {'Actual':>10} {'Budget':>10} {'Var ($)':>10} {'Var (%)':>10} {'Status':>8}")
-print("-" * 60)
-
-for _, row in df.iterrows():
-    print(f"{row['Department']:<15} "
-          f"${row['Actual']:,.0f}".rjust(10) + " " +
-          f"${row['Budget']:,.0f}".rjust(10) + " " +
-          f"${row['Variance ($)']:,.0f}".rjust(10) + " " +
-          f"{row['Variance (%)']:.1f}%".rjust(10) + " " +
-          f"{row['Status']:>8}")
+print("=" * len(header))
+print(header)
+print("-" * len(header))
+print(body)
 
 # 5. Export
 # df.to_excel('variance_analysis.xlsx', index=False)